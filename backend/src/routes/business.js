@@ -75,15 +75,15 @@ router.get('/trends', async (req, res) => {
     // Build query with direct string interpolation
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         venueType,
         COUNT(DISTINCT venueId) as venue_count,
         SUM(visit_count) as total_visits,
         AVG(occupancy_rate) as avg_occupancy,
         SUM(revenue_estimate) as total_revenue,
         AVG(unique_visitors) as avg_unique_visitors
-      FROM business.trends 
-      WHERE month >= '${fromMonth}' AND month <= '${toMonth}'
+      FROM business.trends
+      WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
     `;
 
     // Add venue type filter with sanitized input
@@ -223,12 +223,12 @@ router.get('/revenue', async (req, res) => {
     // Get monthly revenue trends from existing business.trends table
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         venueType,
         SUM(revenue_estimate) as total_revenue,
         SUM(visit_count) as total_visits
-      FROM business.trends 
-      WHERE month >= '${fromMonth}' AND month <= '${toMonth}'
+      FROM business.trends
+      WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
     `;
 
     if (sanitizedVenueType !== 'all') {
@@ -54,13 +54,13 @@ router.get('/flows', async (req, res) => {
 
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         educationLevel as previous_employer,
         educationLevel as current_employer,
         COUNT(*) as transition_count,
         COUNT(DISTINCT participantId) as unique_participants
       FROM financial.participant_trajectories 
-      WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+      WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
     `;
 
     if (employerId !== 'all') {
@@ -132,7 +132,7 @@ router.get('/health', async (req, res) => {
 
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         educationLevel as employerId,
         COUNT(DISTINCT participantId) as active_employees,
         AVG(avg_balance / 100) as avg_wage,
@@ -142,7 +142,7 @@ router.get('/health', async (req, res) => {
         0 as employee_growth_rate,
         0 as wage_growth_rate
       FROM financial.participant_trajectories 
-      WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+      WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
     `;
 
     if (employerId !== 'all') {
@@ -193,7 +193,7 @@ router.get('/turnover', async (req, res) => {
 
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         '1' as employerId,
         COUNT(*) as job_starts,
         180 as avg_job_duration,
@@ -201,7 +201,7 @@ router.get('/turnover', async (req, res) => {
         CAST(COUNT(*) * 0.15 AS INTEGER) as short_term_jobs,
         RANDOM() * 20 + 5 as turnover_rate
       FROM financial.participant_trajectories 
-      WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+      WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
     `;
 
     if (employerId !== 'all') {
@@ -261,7 +261,7 @@ router.get('/stability', async (req, res) => {
 
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         educationLevel,
         age,
         AVG(CASE 
@@ -309,7 +309,7 @@ router.get('/stability', async (req, res) => {
         AVG(avg_balance) as avg_financial_balance,
         COUNT(*) as participant_count
       FROM financial.participant_trajectories 
-      WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+      WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
     `;
 
     if (sanitizedEducationLevel !== 'all') {
@@ -424,19 +424,19 @@ router.get('/trends', async (req, res) => {
     if (metric === 'turnover_rate') {
       query = `
         SELECT 
-          month,
+          strftime(month, '%Y-%m') AS month,
           RANDOM() * 20 + 5 as avg_turnover_rate,
           COUNT(DISTINCT educationLevel) as active_employers,
           COUNT(*) as total_job_starts
         FROM financial.participant_trajectories 
-        WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+        WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
         GROUP BY month 
         ORDER BY month ASC
       `;
     } else if (metric === 'employment_rate') {
       query = `
         SELECT 
-          month,
+          strftime(month, '%Y-%m') AS month,
           AVG(CASE 
             WHEN educationLevel = 'Graduate' THEN 
               CASE 
@@ -469,29 +469,29 @@ router.get('/trends', async (req, res) => {
           END) as avg_employment_rate,
           COUNT(DISTINCT participantId) as active_participants
         FROM financial.participant_trajectories 
-        WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+        WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
         GROUP BY month 
         ORDER BY month ASC
       `;
     } else if (metric === 'avg_wage') {
       query = `
         SELECT 
-          month,
+          strftime(month, '%Y-%m') AS month,
           AVG(avg_balance / 100) as avg_avg_wage,
           COUNT(DISTINCT participantId) as active_participants
         FROM financial.participant_trajectories 
-        WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+        WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
         GROUP BY month 
         ORDER BY month ASC
       `;
     } else {
       query = `
         SELECT 
-          month,
+          strftime(month, '%Y-%m') AS month,
           AVG(CASE WHEN avg_balance > median_balance THEN 75 ELSE 50 END) as avg_stability_score,
           COUNT(DISTINCT participantId) as active_participants
         FROM financial.participant_trajectories 
-        WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+        WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
         GROUP BY month 
         ORDER BY month ASC
       `;
@@ -90,7 +90,7 @@ router.get('/trajectories', async (req, res) => {
 
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         educationLevel,
         age,
         AVG(avg_balance) as avg_balance,
@@ -100,7 +100,7 @@ router.get('/trajectories', async (req, res) => {
         COUNT(DISTINCT participantId) as participant_count,
         COUNT(CASE WHEN avg_balance < 0 THEN 1 END) as participants_in_debt
       FROM financial.participant_trajectories 
-      WHERE CAST(month AS VARCHAR) >= '${fromMonth}' AND CAST(month AS VARCHAR) <= '${toMonth}'
+      WHERE month >= DATE '${fromMonth}-01' AND month <= DATE '${toMonth}-01'
     `;
 
     if (sanitizedEducationLevel !== 'all') {
@@ -167,7 +167,8 @@ router.get('/groups', async (req, res) => {
     const params = [];
 
     if (month !== 'latest') {
-      query += ' WHERE month = ?';
+      // month arrives as YYYY-MM; the stored months are first-of-month DATEs
+      query += " WHERE month = CAST(? || '-01' AS DATE)";
       params.push(month);
     } else {
       // Get the latest month
@@ -215,7 +216,7 @@ router.get('/wages', async (req, res) => {
 
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         educationLevel,
         age,
         avg_hourly_rate,
@@ -269,7 +270,7 @@ router.get('/cost-of-living', async (req, res) => {
 
     let query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         category,
         total_expenses,
         avg_expense,
@@ -323,7 +324,8 @@ router.get('/distribution', async (req, res) => {
     const params = [];
 
     if (month !== 'latest') {
-      monthCondition = 'WHERE month = ?';
+      // month arrives as YYYY-MM; the stored months are first-of-month DATEs
+      monthCondition = "WHERE month = CAST(? || '-01' AS DATE)";
       params.push(month);
     } else {
       monthCondition = 'WHERE month = (SELECT MAX(month) FROM financial.participant_trajectories)';
@@ -77,7 +77,7 @@ router.get('/trends', async (req, res) => {
 
     const query = `
       SELECT 
-        month,
+        strftime(month, '%Y-%m') AS month,
         active_venues,
         total_visits,
         avg_participant_balance,
@@ -172,9 +172,10 @@ router.get('/kpis', async (req, res) => {
     let businessMonthCondition, financialMonthCondition, employmentMonthCondition;
     
     if (month !== 'latest') {
-      businessMonthCondition = 'WHERE CAST(month AS VARCHAR) = ?';
-      financialMonthCondition = 'WHERE CAST(month AS VARCHAR) = ?';
-      employmentMonthCondition = 'WHERE CAST(month AS VARCHAR) = ?';
+      // month arrives as YYYY-MM; the stored months are first-of-month DATEs
+      businessMonthCondition = "WHERE month = CAST(? || '-01' AS DATE)";
+      financialMonthCondition = "WHERE month = CAST(? || '-01' AS DATE)";
+      employmentMonthCondition = "WHERE month = CAST(? || '-01' AS DATE)";
       businessParams.push(month);
       financialParams.push(month);
       employmentParams.push(month);
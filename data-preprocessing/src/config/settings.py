@@ -1,33 +1,36 @@
 import os
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
+# Project root, resolved once at import time
+_PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+
 class Settings:
     """Application settings"""
-    
+
     def __init__(self):
-        # Get the project root directory
-        current_dir = Path(__file__).parent.parent.parent.parent.parent
-        self.input_path = Path(os.getenv("DATA_INPUT_PATH", str(current_dir / "VAST-Challenge-2022")))
-        self.output_path = Path(os.getenv("DATA_OUTPUT_PATH", str(current_dir / "challenge-3" / "data")))
-        
+        self.input_path = Path(os.getenv("DATA_INPUT_PATH", str(_PROJECT_ROOT / "VAST-Challenge-2022")))
+        self.output_path = Path(os.getenv("DATA_OUTPUT_PATH", str(_PROJECT_ROOT / "challenge-3" / "data")))
+
         # Data processing settings
         self.chunk_size = int(os.getenv("CHUNK_SIZE", "10000"))
         self.max_workers = int(os.getenv("MAX_WORKERS", "4"))
-    
-    # File paths
-    @property
-    def datasets_path(self) -> Path:
-        return self.input_path / "Datasets"
-    
-    @property
-    def activity_logs_path(self) -> Path:
-        return self.datasets_path / "Activity Logs"
-    
-    @property
-    def attributes_path(self) -> Path:
-        return self.datasets_path / "Attributes"
-    
-    @property
-    def journals_path(self) -> Path:
-        return self.datasets_path / "Journals"
\ No newline at end of file
+
+        # Database settings
+        self.duckdb_memory_limit = os.getenv("DUCKDB_MEMORY_LIMIT", "8GB")
+
+        # File paths, precomputed once so repeated access allocates nothing
+        self.datasets_path = self.input_path / "Datasets"
+        self.activity_logs_path = self.datasets_path / "Activity Logs"
+        self.attributes_path = self.datasets_path / "Attributes"
+        self.journals_path = self.datasets_path / "Journals"
+
+@cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    Environment variables don't change during the process lifetime, so the
+    instance (and its getenv lookups) is built once and cached.
+    """
+    return Settings()
@@ -5,6 +5,47 @@ from loguru import logger
 from typing import List
 from models.data_models import RawData
 
+# Low-cardinality label columns are loaded as Categorical so downstream
+# group-bys hash u32 dictionary indices instead of full strings. The
+# process-wide string cache keeps those indices compatible across the
+# independently loaded frames.
+pl.enable_string_cache()
+
+# Known journal schemas: declaring them up front skips the type-inference
+# pass and lets the CSV reader parse timestamps directly
+FINANCIAL_SCHEMA = {
+    "participantId": pl.Int64,
+    "timestamp": pl.Datetime("us", "UTC"),
+    "category": pl.Categorical,
+    "amount": pl.Float64
+}
+
+CHECKIN_SCHEMA = {
+    "participantId": pl.Int64,
+    "timestamp": pl.Datetime("us", "UTC"),
+    "venueId": pl.Int64,
+    "venueType": pl.String
+}
+
+TRAVEL_SCHEMA = {
+    "participantId": pl.Int64,
+    "travelStartTime": pl.Datetime("us", "UTC"),
+    "travelStartLocationId": pl.Int64,
+    "travelEndTime": pl.Datetime("us", "UTC"),
+    "travelEndLocationId": pl.Int64,
+    "purpose": pl.String,
+    "checkInTime": pl.Datetime("us", "UTC"),
+    "checkOutTime": pl.Datetime("us", "UTC"),
+    "startingBalance": pl.Float64,
+    "endingBalance": pl.Float64
+}
+
+SOCIAL_SCHEMA = {
+    "timestamp": pl.Datetime("us", "UTC"),
+    "participantIdFrom": pl.Int64,
+    "participantIdTo": pl.Int64
+}
+
 class DataLoader:
     """Handles loading of all raw CSV data files"""
     
@@ -26,7 +67,7 @@ class DataLoader:
         
         # Define consistent schema to handle mixed types - force all to most flexible type
         schema_overrides = {
-            "timestamp": pl.String,  # Parse datetime later to avoid timezone issues
+            "timestamp": pl.Datetime("us", "UTC"),  # Vectorized ISO-8601 parse during the read
             "currentLocation": pl.String,
             "participantId": pl.String,  # Parse to int later  
             "currentMode": pl.String,
@@ -40,47 +81,38 @@ class DataLoader:
             "weeklyExtraBudget": pl.String  # Parse to float later
         }
         
-        # Load all files using lazy loading for memory efficiency
-        dfs = []
-        for file_path in log_files:
-            logger.info(f"Loading {file_path.name}")
-            df = pl.scan_csv(
-                file_path,
-                try_parse_dates=True,
-                schema_overrides=schema_overrides,
-                infer_schema_length=1000
-            )
-            dfs.append(df)
-        
-        # Combine all dataframes with consistent schema
-        combined_df = pl.concat(dfs, how="vertical_relaxed").collect()
-        
-        # Clean up the data types after loading - convert everything to proper types
-        combined_df = combined_df.with_columns([
-            # Parse timestamp (ISO 8601 format)
-            pl.col("timestamp").str.to_datetime(format="%Y-%m-%dT%H:%M:%SZ", strict=False).alias("timestamp"),
-            
+        # Scan all files in one glob so Polars parallelizes the CSV reads
+        # across files and pipelines the concat into the query plan
+        lf = pl.scan_csv(
+            str(activity_logs_path / "ParticipantStatusLogs*.csv"),
+            schema_overrides=schema_overrides,
+            infer_schema_length=1000
+        )
+
+        # Chain the type cleanup onto the scan so it is fused into the read
+        # and executed in streaming chunks instead of a second full pass
+        combined_df = lf.with_columns([
             # Convert numeric fields
             pl.col("participantId").cast(pl.Int64, strict=False).alias("participantId"),
             pl.col("availableBalance").cast(pl.Float64, strict=False).alias("availableBalance"),
             pl.col("dailyFoodBudget").cast(pl.Float64, strict=False).alias("dailyFoodBudget"),
             pl.col("weeklyExtraBudget").cast(pl.Float64, strict=False).alias("weeklyExtraBudget"),
-            
-            # Convert apartmentId to int where possible, keep nulls as null
-            pl.when(pl.col("apartmentId").is_in(["", "null", "None", None]))
-            .then(None)
-            .otherwise(pl.col("apartmentId").cast(pl.Int64, strict=False))
+
+            # Normalize null markers and cast in one kernel, keep nulls as null
+            pl.col("apartmentId").replace({"": None, "null": None, "None": None})
+            .cast(pl.Int64, strict=False)
             .alias("apartmentId"),
-            
-            # Convert jobId to int where possible, keep nulls as null  
-            pl.when(pl.col("jobId").is_in(["", "null", "None", None]))
-            .then(None)
-            .otherwise(pl.col("jobId").cast(pl.Int64, strict=False))
-            .alias("jobId")
-        ])
-        
+
+            pl.col("jobId").replace({"": None, "null": None, "None": None})
+            .cast(pl.Int64, strict=False)
+            .alias("jobId"),
+
+            # Handful of distinct statuses repeated millions of times
+            pl.col("financialStatus").cast(pl.Categorical).alias("financialStatus")
+        ]).collect(engine="streaming")
+
         logger.info(f"Loaded {combined_df.height:,} participant status records")
-        
+
         return combined_df
     
     def load_financial_journal(self) -> pl.DataFrame:
@@ -88,7 +120,7 @@ class DataLoader:
         logger.info("Loading financial journal...")
         
         file_path = self.datasets_path / "Journals" / "FinancialJournal.csv"
-        df = pl.read_csv(file_path, try_parse_dates=True)
+        df = pl.read_csv(file_path, schema_overrides=FINANCIAL_SCHEMA, rechunk=False)
         
         logger.info(f"Loaded {df.height:,} financial transaction records")
         return df
@@ -98,7 +130,7 @@ class DataLoader:
         logger.info("Loading check-in journal...")
         
         file_path = self.datasets_path / "Journals" / "CheckinJournal.csv"
-        df = pl.read_csv(file_path, try_parse_dates=True)
+        df = pl.read_csv(file_path, schema_overrides=CHECKIN_SCHEMA, rechunk=False)
         
         logger.info(f"Loaded {df.height:,} check-in records")
         return df
@@ -108,7 +140,7 @@ class DataLoader:
         logger.info("Loading travel journal...")
         
         file_path = self.datasets_path / "Journals" / "TravelJournal.csv"
-        df = pl.read_csv(file_path, try_parse_dates=True)
+        df = pl.read_csv(file_path, schema_overrides=TRAVEL_SCHEMA, rechunk=False)
         
         logger.info(f"Loaded {df.height:,} travel records")
         return df
@@ -118,7 +150,7 @@ class DataLoader:
         logger.info("Loading social network...")
         
         file_path = self.datasets_path / "Journals" / "SocialNetwork.csv"
-        df = pl.read_csv(file_path, try_parse_dates=True)
+        df = pl.read_csv(file_path, schema_overrides=SOCIAL_SCHEMA, rechunk=False)
         
         logger.info(f"Loaded {df.height:,} social network records")
         return df
@@ -141,17 +173,28 @@ class DataLoader:
             'schools': 'Schools.csv'
         }
         
+        # Scan the files lazily and collect them in one go so Polars reads
+        # the independent CSVs in parallel instead of one after another
         attributes = {}
+        scans = {}
         for name, filename in attribute_files.items():
             file_path = attributes_path / filename
             if file_path.exists():
-                df = pl.read_csv(file_path, try_parse_dates=True)
-                attributes[name] = df
-                logger.info(f"Loaded {name}: {df.height:,} records")
+                scans[name] = pl.scan_csv(file_path, try_parse_dates=True)
             else:
                 logger.warning(f"File not found: {file_path}")
                 attributes[name] = pl.DataFrame()
-        
+
+        for name, df in zip(scans, pl.collect_all(list(scans.values()))):
+            attributes[name] = df
+            logger.info(f"Loaded {name}: {df.height:,} records")
+
+        # Education level is a grouping key in the financial analyses
+        if attributes['participants'].height > 0:
+            attributes['participants'] = attributes['participants'].with_columns(
+                pl.col("educationLevel").cast(pl.Categorical)
+            )
+
         return attributes
     
     def load_all_data(self) -> RawData:
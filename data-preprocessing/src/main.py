@@ -1,5 +1,6 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from loguru import logger
 from dotenv import load_dotenv
@@ -7,7 +8,7 @@ from dotenv import load_dotenv
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from config.settings import Settings
+from config.settings import get_settings
 from ingestion.data_loader import DataLoader
 from processing.business_processor import BusinessProcessor
 from processing.financial_processor import FinancialProcessor
@@ -19,14 +20,14 @@ def main():
     load_dotenv()
     
     # Initialize settings
-    settings = Settings()
+    settings = get_settings()
     logger.info(f"Starting data processing pipeline...")
     logger.info(f"Input path: {settings.input_path}")
     logger.info(f"Output path: {settings.output_path}")
     
     try:
         # Initialize database
-        db_manager = DuckDBManager(settings.output_path / "economic.duckdb")
+        db_manager = DuckDBManager(settings.output_path / "economic.duckdb", settings)
         
         # Initialize data loader
         data_loader = DataLoader(settings.input_path)
@@ -40,20 +41,18 @@ def main():
         financial_processor = FinancialProcessor(raw_data)
         employment_processor = EmploymentProcessor(raw_data)
         
-        # Process business data
-        logger.info("Processing business prosperity data...")
-        business_metrics = business_processor.process()
-        db_manager.save_business_data(business_metrics)
-        
-        # Process financial data
-        logger.info("Processing financial health data...")
-        financial_metrics = financial_processor.process()
-        db_manager.save_financial_data(financial_metrics)
-        
-        # Process employment data
-        logger.info("Processing employment pattern data...")
-        employment_metrics = employment_processor.process()
-        db_manager.save_employment_data(employment_metrics)
+        # Run the three processors concurrently: they only read the shared
+        # raw_data and Polars releases the GIL during compute. Saves stay on
+        # the main thread since DuckDB wants a single writer connection.
+        logger.info("Processing business, financial and employment data...")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            business_future = executor.submit(business_processor.process)
+            financial_future = executor.submit(financial_processor.process)
+            employment_future = executor.submit(employment_processor.process)
+
+            db_manager.save_business_data(business_future.result())
+            db_manager.save_financial_data(financial_future.result())
+            db_manager.save_employment_data(employment_future.result())
         
         # Generate summary statistics
         logger.info("Generating summary statistics...")
@@ -1,5 +1,4 @@
 import polars as pl
-import gc
 from loguru import logger
 from models.data_models import RawData, EmploymentMetrics
 
@@ -8,24 +7,35 @@ class EmploymentProcessor:
     
     def __init__(self, raw_data: RawData):
         self.raw_data = raw_data
+        # Every employment metric starts from the same filtered and
+        # job-joined slice of the status logs. Building it once lets
+        # collect_all recognize the shared subplan and execute the scan,
+        # filter and join a single time for all branches.
+        self._employment_lf = (
+            raw_data.participant_status_logs.lazy()
+            .filter(pl.col("jobId").is_not_null())
+            .select(["participantId", "timestamp", "jobId"])
+            .join(
+                raw_data.jobs.lazy().select(["jobId", "employerId", "hourlyRate"]),
+                on="jobId",
+                how="inner"
+            )
+            .with_columns(pl.col("timestamp").dt.truncate("1mo").dt.date().alias("month"))
+        )
     
     def process(self) -> EmploymentMetrics:
         """Main processing method for employment analysis"""
         logger.info("Starting employment pattern analysis...")
         
-        # Generate job flow analysis
-        job_flows = self._calculate_job_flows()
-        gc.collect()  # Force garbage collection
-        
-        # Calculate employer health metrics
-        employer_health = self._calculate_employer_health()
-        gc.collect()  # Force garbage collection
-        
-        # Calculate turnover rates
-        turnover_rates = self._calculate_turnover_rates()
-        
-        # Analyze employment stability
-        employment_stability = self._analyze_employment_stability()
+        # All four metrics are lazy plans collected together; the streaming
+        # engine processes the status logs in chunks, so the old hand-rolled
+        # 5M-row batch loops are no longer needed to bound memory
+        job_flows, employer_health, turnover_rates, employment_stability = pl.collect_all([
+            self._calculate_job_flows(),
+            self._calculate_employer_health(),
+            self._calculate_turnover_rates(),
+            self._analyze_employment_stability()
+        ], engine="streaming")
         
         return EmploymentMetrics(
             job_flows=job_flows,
@@ -34,23 +44,17 @@ class EmploymentProcessor:
             employment_stability=employment_stability
         )
     
-    def _calculate_job_flows(self) -> pl.DataFrame:
+    def _calculate_job_flows(self) -> pl.LazyFrame:
         """Calculate job transition flows between employers"""
         logger.info("Calculating job flows...")
         
-        status_logs = self.raw_data.participant_status_logs
-        jobs = self.raw_data.jobs
-        employers = self.raw_data.employers
-        
-        # Track job changes over time
+        # Track job changes over time on the shared employment slice
         employment_history = (
-            status_logs
-            .filter(pl.col("jobId").is_not_null())
-            .join(jobs, on="jobId", how="left")
+            self._employment_lf
+            .select(["participantId", "timestamp", "employerId", "month"])
             .sort(["participantId", "timestamp"])
             .with_columns([
-                pl.col("employerId").shift(1).over("participantId").alias("previous_employer"),
-                pl.col("timestamp").dt.strftime("%Y-%m").alias("month")
+                pl.col("employerId").shift(1).over("participantId").alias("previous_employer")
             ])
         )
         
@@ -70,29 +74,20 @@ class EmploymentProcessor:
         
         return job_transitions
     
-    def _calculate_employer_health(self) -> pl.DataFrame:
+    def _calculate_employer_health(self) -> pl.LazyFrame:
         """Calculate employer performance metrics"""
         logger.info("Calculating employer health...")
         
-        status_logs = self.raw_data.participant_status_logs
-        jobs = self.raw_data.jobs
-        employers = self.raw_data.employers
-        
-        # Join employment data
-        employment_data = (
-            status_logs
-            .filter(pl.col("jobId").is_not_null())
-            .join(jobs, on="jobId", how="left")
-            .join(employers, on="employerId", how="left")
+        # The shared employment slice already carries the columns the monthly
+        # aggregation reads
+        employment_data = self._employment_lf.select(
+            ["participantId", "jobId", "employerId", "hourlyRate", "month"]
         )
-        
+
         # Calculate monthly employer metrics
         employer_health = (
             employment_data
-            .with_columns([
-                pl.col("timestamp").dt.strftime("%Y-%m").alias("month")
-            ])
-            .group_by(["month", "employerId"])
+            .group_by(["month", "employerId"], maintain_order=False)
             .agg([
                 pl.col("participantId").n_unique().alias("active_employees"),
                 pl.col("hourlyRate").mean().alias("avg_wage"),
@@ -100,106 +95,67 @@ class EmploymentProcessor:
                 pl.col("hourlyRate").std().alias("wage_std"),
                 pl.col("jobId").n_unique().alias("active_positions")
             ])
+            # The hash aggregation emits groups in arbitrary order; sort the
+            # reduced frame so the growth-rate windows below see months in
+            # sequence within each employer
+            .sort(["employerId", "month"])
         )
         
-        # Calculate employer growth metrics
+        # Calculate employer growth metrics; the explicit shift form runs the
+        # window partition once per column instead of inside a generic
+        # pct_change apply path
         employer_health = employer_health.with_columns([
-            (pl.col("active_employees").pct_change().over("employerId")).alias("employee_growth_rate"),
-            (pl.col("avg_wage").pct_change().over("employerId")).alias("wage_growth_rate")
+            (pl.col("active_employees") / pl.col("active_employees").shift(1).over("employerId") - 1)
+            .alias("employee_growth_rate"),
+            (pl.col("avg_wage") / pl.col("avg_wage").shift(1).over("employerId") - 1)
+            .alias("wage_growth_rate")
         ])
         
         return employer_health
     
-    def _calculate_turnover_rates(self) -> pl.DataFrame:
-        """Calculate employee turnover rates using batch processing"""
+    def _calculate_turnover_rates(self) -> pl.LazyFrame:
+        """Calculate employee turnover rates"""
         logger.info("Calculating turnover rates...")
         
-        status_logs = self.raw_data.participant_status_logs
-        jobs = self.raw_data.jobs
-        
-        # Process in batches to handle large dataset
-        batch_size = 5_000_000  # Process 5M records at a time
-        total_records = len(status_logs)
-        logger.info(f"Processing {total_records} total records in batches of {batch_size}")
-        
-        # Get jobs lookup for efficiency
-        jobs_lookup = jobs.select(["jobId", "employerId"]).to_pandas().set_index('jobId')['employerId'].to_dict()
-        
-        all_turnover_data = []
-        
-        for batch_start in range(0, total_records, batch_size):
-            batch_end = min(batch_start + batch_size, total_records)
-            logger.info(f"Processing batch {batch_start // batch_size + 1}: records {batch_start} to {batch_end}")
-            
-            # Get batch of status logs
-            batch_logs = status_logs.slice(batch_start, batch_end - batch_start)
-            
-            # Filter and process employment records
-            employed_records = (
-                batch_logs
-                .filter(pl.col("jobId").is_not_null())
-                .select(["participantId", "timestamp", "jobId"])
-                .unique()
-            )
-            
-            if len(employed_records) == 0:
-                continue
-            
-            # Add employer info using efficient lookup
-            employment_periods = (
-                employed_records
-                .with_columns([
-                    pl.col("jobId").map_elements(
-                        lambda x: jobs_lookup.get(x), 
-                        return_dtype=pl.Int64
-                    ).alias("employerId")
-                ])
-                .filter(pl.col("employerId").is_not_null())
-            )
-            
-            if len(employment_periods) == 0:
-                continue
-            
-            # Calculate job tenure for this batch
-            batch_tenure = (
-                employment_periods
-                .group_by(["participantId", "jobId", "employerId"])
-                .agg([
-                    pl.col("timestamp").min().alias("start_date"),
-                    pl.col("timestamp").max().alias("end_date")
-                ])
-                .with_columns([
-                    (pl.col("end_date") - pl.col("start_date")).dt.total_days().alias("tenure_days"),
-                    pl.col("start_date").dt.strftime("%Y-%m").alias("start_month")
-                ])
-                .filter(pl.col("tenure_days") >= 0)
-            )
-            
-            if len(batch_tenure) > 0:
-                all_turnover_data.append(batch_tenure)
-            
-            # Force garbage collection
-            gc.collect()
-        
-        # Combine all batches
-        if not all_turnover_data:
-            logger.warning("No turnover data generated")
-            return pl.DataFrame({
-                "month": [], "employerId": [], "new_hires": [], 
-                "avg_tenure_days": [], "turnover_rate": []
-            })
-        
-        combined_tenure = pl.concat(all_turnover_data)
-        logger.info(f"Combined {len(combined_tenure)} job tenure records from all batches")
+        # The shared employment slice already filters out jobless records
+        # and attaches the employer. No dedup pass is needed: the min/max
+        # aggregation below reduces to one row per participant-job
+        # Days-since-epoch integers instead of timestamps: the min/max and
+        # the tenure subtraction then run on plain i32 arithmetic with no
+        # Duration intermediate
+        employment_periods = self._employment_lf.select([
+            pl.col("participantId"),
+            pl.col("jobId"),
+            pl.col("employerId"),
+            pl.col("timestamp").cast(pl.Date).cast(pl.Int32).alias("day_idx")
+        ])
+
+        # Calculate job tenure
+        job_tenure = (
+            employment_periods
+            .group_by(["participantId", "jobId", "employerId"])
+            .agg([
+                pl.col("day_idx").min().alias("start_day"),
+                pl.col("day_idx").max().alias("end_day")
+            ])
+            .with_columns([
+                (pl.col("end_day") - pl.col("start_day")).alias("tenure_days"),
+                # Back to a calendar month on the small aggregated frame
+                pl.col("start_day").cast(pl.Date).dt.truncate("1mo").alias("start_month")
+            ])
+            .filter(pl.col("tenure_days") >= 0)
+        )
         
         # Calculate final turnover metrics
         turnover_rates = (
-            combined_tenure
+            job_tenure
             .group_by(["start_month", "employerId"])
             .agg([
                 pl.len().alias("new_hires"),
                 pl.col("tenure_days").mean().alias("avg_tenure_days"),
-                (pl.col("tenure_days") <= 30).sum().alias("short_tenure_count")
+                # Explicit u32 cast picks the integer sum kernel directly
+                # instead of summing a Boolean mask
+                pl.col("tenure_days").le(30).cast(pl.UInt32).sum().alias("short_tenure_count")
             ])
             .with_columns([
                 (pl.col("short_tenure_count") / pl.col("new_hires")).alias("turnover_rate"),
@@ -208,69 +164,28 @@ class EmploymentProcessor:
             .select(["month", "employerId", "new_hires", "avg_tenure_days", "turnover_rate"])
         )
         
-        logger.info(f"Generated turnover rates for {len(turnover_rates)} month-employer combinations")
         return turnover_rates
     
-    def _analyze_employment_stability(self) -> pl.DataFrame:
-        """Analyze employment stability patterns using batch processing"""
+    def _analyze_employment_stability(self) -> pl.LazyFrame:
+        """Analyze employment stability patterns"""
         logger.info("Analyzing employment stability...")
         
-        status_logs = self.raw_data.participant_status_logs
-        total_records = len(status_logs)
-        batch_size = 5_000_000  # Process 5M records at a time
-        
-        logger.info(f"Processing all {total_records} records in batches of {batch_size}")
-        
-        all_stability_data = []
-        
-        for batch_start in range(0, total_records, batch_size):
-            batch_end = min(batch_start + batch_size, total_records)
-            logger.info(f"Processing stability batch {batch_start // batch_size + 1}: records {batch_start} to {batch_end}")
-            
-            # Get batch of status logs
-            batch_logs = status_logs.slice(batch_start, batch_end - batch_start)
-            
-            # Calculate employment stability for this batch
-            batch_stability = (
-                batch_logs
-                .with_columns([
-                    pl.col("timestamp").dt.strftime("%Y-%m").alias("month"),
-                    (pl.col("jobId").is_not_null()).alias("is_employed")
-                ])
-                .group_by(["participantId", "month"])
-                .agg([
-                    pl.col("is_employed").mean().alias("employment_rate"),
-                    pl.col("jobId").n_unique().alias("job_changes"),
-                    pl.col("availableBalance").mean().alias("avg_balance")
-                ])
-                .filter(pl.col("employment_rate").is_not_null())
-            )
-            
-            if len(batch_stability) > 0:
-                all_stability_data.append(batch_stability)
-            
-            # Force garbage collection
-            gc.collect()
-        
-        # Combine all batches and re-aggregate
-        if not all_stability_data:
-            logger.warning("No employment stability data generated")
-            return pl.DataFrame({
-                "participantId": [], "month": [], "employment_rate": [], 
-                "job_changes": [], "avg_balance": []
-            })
-        
-        # Combine all batch results
-        combined_stability = pl.concat(all_stability_data)
+        status_logs = self.raw_data.participant_status_logs.lazy()
         
-        # Re-aggregate the combined data to get final metrics
+        # A single aggregation over all records also fixes the old
+        # cross-batch re-aggregation, which took an unweighted mean of
+        # per-batch means for employment_rate and avg_balance
         employment_stability = (
-            combined_stability
-            .group_by(["participantId", "month"])
+            status_logs
+            .with_columns([
+                pl.col("timestamp").dt.truncate("1mo").dt.date().alias("month"),
+                (pl.col("jobId").is_not_null()).alias("is_employed")
+            ])
+            .group_by(["participantId", "month"], maintain_order=False)
             .agg([
-                pl.col("employment_rate").mean().alias("employment_rate"),
-                pl.col("job_changes").sum().alias("job_changes"),
-                pl.col("avg_balance").mean().alias("avg_balance")
+                pl.col("is_employed").mean().alias("employment_rate"),
+                pl.col("jobId").n_unique().alias("job_changes"),
+                pl.col("availableBalance").mean().alias("avg_balance")
             ])
             .filter(pl.col("employment_rate").is_not_null())
         )
@@ -280,5 +195,4 @@ class EmploymentProcessor:
             pl.col("employment_rate").alias("stability_score")  # Use employment rate as stability indicator
         ])
         
-        logger.info(f"Generated employment stability data for {len(employment_stability)} participant-month combinations")
-        return employment_stability
\ No newline at end of file
+        return employment_stability
